@@ -1,8 +1,13 @@
 name = 'nfl_data_py'
 
+import io
 import os
+import importlib.util
+import glob
+import time
+import shutil
 import logging
-import datetime
+import functools
 from warnings import warn
 from typing import Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -10,6 +15,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy
 import pandas
 import appdirs
+import fsspec
+import fastparquet
+from fsspec.parquet import open_parquet_file
+from fsspec.utils import infer_compression
 from urllib.error import HTTPError
 
 # module level doc string
@@ -50,9 +59,329 @@ see_pbp_cols() - return list of play-by-play columns
 see_weekly_cols() - return list of weekly stat columns
 import_team_desc() - import descriptive data for team viz
 cache_pbp() - save pbp files locally to allow for faster loading
+clear_cache() - clear memoized and temporarily cached downloads
 clean_nfl_data() - clean df by aligning common name diffs
 """
 
+# columns published in the pbp participation release, used to project reads
+PARTIC_COLS = [
+    'nflverse_game_id', 'play_id', 'possession_team', 'offense_formation',
+    'offense_personnel', 'defenders_in_box', 'defense_personnel',
+    'number_of_pass_rushers', 'players_on_play', 'offense_players',
+    'defense_players', 'n_offense', 'n_defense', 'ngs_air_yards',
+    'time_to_throw', 'was_pressure', 'route', 'defense_man_zone_type',
+    'defense_coverage_type'
+]
+
+# player name spellings aligned by clean_nfl_data()
+_NAME_REPL = {
+    'Gary Jennings Jr': 'Gary Jennings',
+    'DJ Chark': 'D.J. Chark',
+    'Cedrick Wilson Jr.': 'Cedrick Wilson',
+    'Deangelo Yancey': 'DeAngelo Yancey',
+    'Ardarius Stewart': 'ArDarius Stewart',
+    'Calvin Johnson  HOF': 'Calvin Johnson',
+    'Mike Sims-Walker': 'Mike Walker',
+    'Kenneth Moore': 'Kenny Moore',
+    'Devante Parker': 'DeVante Parker',
+    'Brandon Lafell': 'Brandon LaFell',
+    'Desean Jackson': 'DeSean Jackson',
+    'Deandre Hopkins': 'DeAndre Hopkins',
+    'Deandre Smelter': 'DeAndre Smelter',
+    'William Fuller': 'Will Fuller',
+    'Lavon Brazill': 'LaVon Brazill',
+    'Devier Posey': 'DeVier Posey',
+    'Demarco Sampson': 'DeMarco Sampson',
+    'Deandrew Rubin': 'DeAndrew Rubin',
+    'Latarence Dunbar': 'LaTarence Dunbar',
+    'Jajuan Dawson': 'JaJuan Dawson',
+    "Andre' Davis": 'Andre Davis',
+    'Johnathan Holland': 'Jonathan Holland',
+    'Johnnie Lee Higgins Jr.': 'Johnnie Lee Higgins',
+    'Marquis Walker': 'Marquise Walker',
+    'William Franklin': 'Will Franklin',
+    'Ted Ginn Jr.': 'Ted Ginn',
+    'Jonathan Baldwin': 'Jon Baldwin',
+    'T.J. Graham': 'Trevor Graham',
+    'Odell Beckham Jr.': 'Odell Beckham',
+    'Michael Pittman Jr.': 'Michael Pittman',
+    'DK Metcalf': 'D.K. Metcalf',
+    'JJ Arcega-Whiteside': 'J.J. Arcega-Whiteside',
+    'Lynn Bowden Jr.': 'Lynn Bowden',
+    'Laviska Shenault Jr.': 'Laviska Shenault',
+    'Henry Ruggs III': 'Henry Ruggs',
+    'KJ Hamler': 'K.J. Hamler',
+    'KJ Osborn': 'K.J. Osborn',
+    'Devonta Smith': 'DeVonta Smith',
+    'Terrace Marshall Jr.': 'Terrace Marshall',
+    "Ja'Marr Chase": 'JaMarr Chase'
+}
+
+# college team names aligned by clean_nfl_data()
+_COL_TM_REPL = {
+    'Ole Miss': 'Mississippi',
+    'Texas Christian': 'TCU',
+    'Central Florida': 'UCF',
+    'Bowling Green State': 'Bowling Green',
+    'West. Michigan': 'Western Michigan',
+    'Pitt': 'Pittsburgh',
+    'Brigham Young': 'BYU',
+    'Texas-El Paso': 'UTEP',
+    'East. Michigan': 'Eastern Michigan',
+    'Middle Tenn. State': 'Middle Tennessee State',
+    'Southern Miss': 'Southern Mississippi',
+    'Louisiana State': 'LSU'
+}
+
+# pyarrow is optional, when installed it can memory-map local parquet files
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# http clients keyed by process id, so connections are kept alive and reused
+_HTTP_FS = {}
+
+# whole release files downloaded through the file cache, keyed by process id
+_FILE_CACHE_FS = {}
+
+# seconds that downloaded files are reused before being fetched again
+_CACHE_TTL = 3600
+
+
+def __http_fs():
+    """Returns the http filesystem shared by all threads of this process"""
+    
+    pid = os.getpid()
+    if pid not in _HTTP_FS:
+        _HTTP_FS[pid] = fsspec.filesystem('https', skip_instance_cache=True)
+    
+    return _HTTP_FS[pid]
+
+
+def __file_cache_dir():
+    """Returns the directory the file cache stores downloads in"""
+    
+    return os.path.join(appdirs.user_cache_dir('nfl_data_py', 'nflverse'), 'files')
+
+
+def __file_cache_fs():
+    """Returns an http filesystem that keeps whole downloads on disk for _CACHE_TTL seconds"""
+    
+    pid = os.getpid()
+    if pid not in _FILE_CACHE_FS:
+        _FILE_CACHE_FS[pid] = fsspec.filesystem(
+            'filecache',
+            fs=__http_fs(),
+            cache_storage=__file_cache_dir(),
+            expiry_time=_CACHE_TTL,
+            skip_instance_cache=True
+        )
+    
+    return _FILE_CACHE_FS[pid]
+
+
+def __read_parquet(path, columns=None, filters=None):
+    """Reads a parquet file, only fetching the requested columns when remote
+    
+    Args:
+        path (str): url or local path of parquet file
+        columns (List[str]): only read these columns
+        filters (List[Tuple]): skip row groups whose statistics fail these filters,
+            rows still need filtering by the caller
+    Returns:
+        DataFrame
+    """
+    
+    kwargs = {'filters': filters} if filters else {}
+    
+    if str(path).startswith('http'):
+        # byte-range requests for the footer and the needed column chunks only
+        with open_parquet_file(path, fs=__http_fs(), columns=columns) as f:
+            return pandas.read_parquet(f, columns=columns, engine='auto', **kwargs)
+    
+    # local files, such as the pbp cache, are mapped instead of copied into buffers
+    if _HAS_PYARROW:
+        return pandas.read_parquet(path, columns=columns, engine='pyarrow', memory_map=True, **kwargs)
+    
+    return pandas.read_parquet(path, columns=columns, engine='auto', **kwargs)
+
+
+def __parallel_read_parquet(urls, columns=None, max_workers=8, downcast=False):
+    """Reads parquet files on a thread pool, keeping the order of urls
+    
+    Args:
+        urls (List[str]): urls of parquet files
+        columns (List[str]): only read these columns
+        max_workers (int): most files read at once, default 8
+        downcast (bool): convert float64 to float32 as each file lands, default False
+    Returns:
+        List[DataFrame]
+    """
+    
+    urls = list(urls)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(len(urls), max_workers))) as executor:
+        # Create a list of the same size as urls, initialized with None
+        data = [None]*len(urls)
+        # Create a mapping of futures to their corresponding index in the data
+        futures_map = {
+            executor.submit(__read_parquet, path=url, columns=columns): idx
+            for idx, url in enumerate(urls)
+        }
+        for future in as_completed(futures_map):
+            df = future.result()
+            data[futures_map[future]] = __downcast_floats(df) if downcast else df
+    
+    return data
+
+
+def __read_parquets(urls, columns=None):
+    """Reads several remote parquet files, downloading them concurrently
+    
+    Args:
+        urls (List[str]): urls of parquet files
+        columns (List[str]): only read these columns
+    Returns:
+        List[DataFrame]
+    """
+    
+    urls = list(urls)
+    
+    if columns:
+        # projected reads stay on byte-range requests
+        return __parallel_read_parquet(urls, columns=columns)
+    
+    # whole files are fetched as one batch on the filesystem's event loop,
+    # and kept on disk so repeat calls within _CACHE_TTL skip the download
+    blobs = __file_cache_fs().cat(urls)
+    
+    return [pandas.read_parquet(io.BytesIO(blobs[url]), engine='auto') for url in urls]
+
+
+@functools.lru_cache(maxsize=32)
+def __fetch_bytes(url, ttl_hash):
+    """Downloads a remote file, memoized per url and ttl window
+    
+    Args:
+        url (str): url of file
+        ttl_hash (int): current ttl window, changes every _CACHE_TTL seconds
+    Returns:
+        bytes
+    """
+    
+    return __http_fs().cat_file(url)
+
+
+def __read_csv(url, **kwargs):
+    """Reads a remote csv file using the shared http client and download cache
+    
+    Args:
+        url (str): url of csv file
+        kwargs: passed through to pandas.read_csv
+    Returns:
+        DataFrame
+    """
+    
+    data = io.BytesIO(__fetch_bytes(url, int(time.time() // _CACHE_TTL)))
+    
+    return pandas.read_csv(data, compression=infer_compression(url), **kwargs)
+
+
+def __read_parquet_columns(url):
+    """Reads the column names of a remote parquet file from its footer only
+    
+    Args:
+        url (str): url of parquet file
+    Returns:
+        Index
+    """
+    
+    # aligned blocks usually let the footer length and footer arrive in one request
+    with __http_fs().open(url, 'rb', cache_type='blockcache', block_size=2**20) as f:
+        pf = fastparquet.ParquetFile(f)
+    
+    index_cols = pf.pandas_metadata.get('index_columns', []) if pf.has_pandas_metadata else []
+    
+    return pandas.Index([col for col in pf.columns if col not in index_cols])
+
+
+def __read_participation(url, columns=None):
+    """Reads a pbp participation file, allowing for columns older seasons lack
+    
+    Args:
+        url (str): url of participation file
+        columns (List[str]): only read these columns, ones missing from the file come back as NaN
+    Returns:
+        DataFrame
+    """
+    
+    if not columns:
+        return __read_parquet(url)
+    
+    # older seasons publish fewer participation columns, so project onto the file's own
+    available = set(__read_parquet_columns(url))
+    df = __read_parquet(url, columns=[x for x in columns if x in available])
+    
+    return df.reindex(columns=columns)
+
+
+def __validate_years(years, earliest):
+    """Checks that years is a list or range with no season before earliest
+    
+    Args:
+        years (List[int]): years passed to an importer
+        earliest (int): first season the data is available for
+    Raises:
+        ValueError
+    """
+    
+    if not isinstance(years, (list, range)):
+        raise ValueError('Input must be list or range.')
+    
+    # a single pass that stops at the first unavailable season
+    for year in years:
+        if year < earliest:
+            raise ValueError('Data not available before {0}.'.format(earliest))
+
+
+def __game_id_seasons(game_ids):
+    """Parses seasons from the leading year of nflverse game ids
+    
+    Args:
+        game_ids (Series): game ids such as 2020_01_HOU_KC
+    Returns:
+        ndarray, NaN where the game id is missing
+    """
+    
+    # many rows share a game, so only parse each distinct id once
+    codes, uniques = pandas.factorize(game_ids)
+    parsed = uniques.str.slice(0, 4).astype(int).to_numpy()
+    
+    # factorize codes missing ids as -1, which would otherwise index the last season
+    missing = codes == -1
+    if not missing.any():
+        return parsed[codes]
+    
+    seasons = numpy.full(len(codes), numpy.nan)
+    seasons[~missing] = parsed[codes[~missing]]
+    
+    return seasons
+
+
+def __downcast_floats(df):
+    """Converts float64 columns to float32 in a single astype call
+    
+    Args:
+        df (DataFrame): DataFrame to downcast
+    Returns:
+        DataFrame
+    """
+    
+    float_cols = df.select_dtypes(include=[numpy.float64]).columns
+    if len(float_cols) == 0:
+        return df
+    
+    return df.astype({col: numpy.float32 for col in float_cols}, copy=False)
+
+
 def import_pbp_data(
         years, 
         columns=None, 
@@ -71,31 +400,41 @@ def import_pbp_data(
         downcast (bool): convert float64 to float32, default True
         cache (bool): whether to use local cache as source of pbp data
         alt_path (str): path for cache if not nfl_data_py default
+        thread_requests (bool): use thread pool to read files, default False
     Returns:
         DataFrame
     """
     
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-        
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
+    __validate_years(years, 1999)
     
     if not columns:
         columns = []
 
     columns = [x for x in columns if x not in ['season']]
-    
-    if all([include_participation, len(columns) != 0]):
-        columns = columns + [x for x in ['play_id','old_game_id'] if x not in columns]
+
+    # only read the participation columns that were asked for, plus merge keys
+    partic_cols = None
+    if include_participation and not cache and len(columns) != 0:
+        partic_cols = [
+            x for x in columns
+            if x in PARTIC_COLS and x not in ['play_id', 'nflverse_game_id']
+        ]
+        if partic_cols:
+            columns = [x for x in columns if x not in partic_cols]
+            columns = columns + [x for x in ['play_id', 'game_id'] if x not in columns]
+            partic_cols = ['play_id', 'nflverse_game_id'] + partic_cols
+        else:
+            include_participation = False
        
     # potential sources for pbp data
     url1 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_'
     url2 = r'.parquet'
+    partic_url = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'
     appname = 'nfl_data_py'
-    appauthor = 'cooper_dff'
+    appauthor = 'nflverse'
     pbp_data = []
+    partic_data = []
     
     if cache:
         if not alt_path:
@@ -103,79 +442,104 @@ def import_pbp_data(
         else:
             dpath = alt_path
 
+        # locate every cached season up front so a partial cache fails before any reads
+        cache_paths = {
+            year: sorted(glob.glob(os.path.join(dpath, f'season={year}', '*.parquet')))
+            for year in years
+        }
+        for year, paths in cache_paths.items():
+            if not paths:
+                raise ValueError(f'{year} cache file does not exist.')
+
     if thread_requests and not cache:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            pbp_data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the pbp_data
+        partic_years = years if include_participation else []
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(years) + len(partic_years)))) as executor:
+            # Submit pbp and participation reads together so their downloads overlap
             futures_map = {
                 executor.submit(
-                    pandas.read_parquet,
+                    __read_parquet,
                     path=url1 + str(year) + url2,
-                    columns=columns if columns else None, 
-                    engine='auto'
-                ): idx 
-                for idx, year in enumerate(years)
+                    columns=columns if columns else None
+                ): (year, 'pbp')
+                for year in years
             }
+            futures_map.update({
+                executor.submit(
+                    __read_participation,
+                    url=partic_url.format(year),
+                    columns=partic_cols
+                ): (year, 'partic')
+                for year in partic_years
+            })
+            results = {year: {} for year in years}
             for future in as_completed(futures_map):
-                pbp_data[futures_map[future]] = future.result()
+                year, kind = futures_map[future]
+                try:
+                    # downcast as each file lands so full float64 years never pile up
+                    result = future.result()
+                    results[year][kind] = __downcast_floats(result) if downcast else result
+                except (HTTPError, FileNotFoundError):
+                    if kind == 'pbp':
+                        raise
+
+        for year in years:
+            raw = results[year]['pbp']
+            raw['season'] = year
+            pbp_data.append(raw)
+            if 'partic' in results[year]:
+                partic_data.append(results[year]['partic'])
     else:
         # read in pbp data
         for year in years:
-            if cache:
-                seasonStr = f'season={year}'
-                if not os.path.isdir(os.path.join(dpath, seasonStr)):
-                    raise ValueError(f'{year} cache file does not exist.')
-                for fname in filter(lambda x: seasonStr in x, os.listdir(dpath)):
-                    folder = os.path.join(dpath, fname)
-                    for file in os.listdir(folder):
-                        if file.endswith(".parquet"):
-                            fpath = os.path.join(folder, file)
-                
-            # define path based on cache and alt_path variables
-                path = fpath
-            else:
-                path = url1 + str(year) + url2
+            paths = cache_paths[year] if cache else [url1 + str(year) + url2]
 
             # load data
             try:
-                data = pandas.read_parquet(path, columns=columns if columns else None, engine='auto')
-
-                raw = pandas.DataFrame(data)
+                frames = [
+                    __read_parquet(path, columns=columns if columns else None)
+                    for path in paths
+                ]
+                # a single file is used as read, concat would only copy it
+                raw = frames[0] if len(frames) == 1 else pandas.concat(frames, ignore_index=True, copy=False)
                 raw['season'] = year
-                
-
-                if include_participation and not cache:
-                    path = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'.format(year)
-
-                    try:
-                        partic = pandas.read_parquet(path)
-                        raw = raw.merge(
-                            partic,
-                            how='left',
-                            left_on=['play_id','game_id'],
-                            right_on=['play_id','nflverse_game_id']
-                        )
-                    except HTTPError:
-                        pass
-                
-                pbp_data.append(raw)
-                print(str(year) + ' done.')
 
             except Exception as e:
                 print(e)
                 print('Data not available for ' + str(year))
+                continue
+            
+            pbp_data.append(__downcast_floats(raw) if downcast else raw)
+
+            # participation errors are handled as on the threaded path, outside the pbp fallback
+            if include_participation and not cache:
+                try:
+                    partic_data.append(
+                        __read_participation(partic_url.format(year), columns=partic_cols)
+                    )
+                except (HTTPError, FileNotFoundError):
+                    pass
+            
+            print(str(year) + ' done.')
     
     if not pbp_data:
         return pandas.DataFrame()
     
-    plays = pandas.concat(pbp_data, ignore_index=True)
+    plays = pandas.concat(pbp_data, ignore_index=True, copy=False)
+    
+    # merge participation for all seasons at once, game ids are unique across seasons
+    if partic_data:
+        plays = plays.merge(
+            pandas.concat(partic_data, ignore_index=True, copy=False),
+            how='left',
+            left_on=['play_id','game_id'],
+            right_on=['play_id','nflverse_game_id']
+        )
     
     # converts float64 to float32, saves ~30% memory
+    # seasons are downcast as they load, this catches the merged participation columns
     if downcast:
         print('Downcasting floats.')
-        cols = plays.select_dtypes(include=[numpy.float64]).columns
-        plays[cols] = plays[cols].astype(numpy.float32)
+        plays = __downcast_floats(plays)
             
     return plays
 
@@ -191,11 +555,7 @@ def cache_pbp(years, downcast=True, alt_path=None):
         DataFrame
     """
 
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
+    __validate_years(years, 1999)
 
     url1 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_'
     url2 = r'.parquet'
@@ -213,46 +573,72 @@ def cache_pbp(years, downcast=True, alt_path=None):
         os.makedirs(path)
 
     # delete seasons to be replaced
-    for folder in [os.path.join(path, x) for x in os.listdir(path) for y in years if ('season='+str(y)) in x]:
-        for file in os.listdir(folder):
-            if file.endswith(".parquet"):
-                os.remove(os.path.join(folder, file))
-
-    # read in pbp data
-    for year in years:
+    replace = {f'season={y}' for y in years}
+    for folder in os.scandir(path):
+        if folder.name in replace and folder.is_dir():
+            for file in os.scandir(folder.path):
+                if file.name.endswith(".parquet"):
+                    os.remove(file.path)
+
+    def fetch_year(year):
+        raw = __read_parquet(url1 + str(year) + url2)
+        raw['season'] = year
+
+        if year >= 2016:
+            path2 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'.format(year)
+            try:
+                part = __read_parquet(path2)
+                raw = raw.merge(part, how='left', on=['play_id','old_game_id'])
+            except (HTTPError, FileNotFoundError):
+                pass
 
-        try:
+        if downcast:
+            raw = __downcast_floats(raw)
 
-            data = pandas.read_parquet(url1 + str(year) + url2, engine='auto')
+        return raw
 
-            raw = pandas.DataFrame(data)
-            raw['season'] = year
+    # download years in parallel, parquet writes to the cache stay serial
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(years)))) as executor:
+        futures_map = {executor.submit(fetch_year, year): year for year in years}
+        for future in as_completed(futures_map):
+            year = futures_map[future]
 
-            if year >= 2016:
-                path2 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'.format(year)
-                part = pandas.read_parquet(path2)
-                raw = raw.merge(part, how='left', on=['play_id','old_game_id'])
+            try:
+                raw = future.result()
 
-            if downcast:
-                cols = raw.select_dtypes(include=[numpy.float64]).columns
-                raw[cols] = raw[cols].astype(numpy.float32)
+                # write parquet to path, partitioned by season, zstd keeps the
+                # cache smaller than snappy and still decodes quickly
+                raw.to_parquet(path, partition_cols='season', compression='zstd')
 
-            # write parquet to path, partitioned by season
-            raw.to_parquet(path, partition_cols='season')
+                print(str(year) + ' done.')
 
-            print(str(year) + ' done.')
+            except Exception as e:
+                warn(
+                    f"Caching failed for {year}, skipping.\n"
+                    "In nfl_data_py 1.0, this will raise an exception.\n"
+                    f"Failure: {e}",
+                    DeprecationWarning,
+                    stacklevel=2
+                )
+            
 
-        except Exception as e:
-            warn(
-                f"Caching failed for {year}, skipping.\n"
-                "In nfl_data_py 1.0, this will raise an exception.\n"
-                f"Failure: {e}",
-                DeprecationWarning,
-                stacklevel=2
-            )
+def clear_cache():
+    """Clears memoized and temporarily cached downloads
+    
+    Small reference files (schedules, ids, officials, etc.) and whole-season
+    release files are reused for up to an hour after download, and the pbp/weekly
+    column lists for the whole session. This forces the next call to fetch them
+    again. The pbp cache created by cache_pbp() is not affected.
+    """
+    
+    __fetch_bytes.cache_clear()
+    see_pbp_cols.cache_clear()
+    see_weekly_cols.cache_clear()
+    
+    # drop the on-disk file cache along with the filesystems holding its metadata
+    _FILE_CACHE_FS.clear()
+    shutil.rmtree(__file_cache_dir(), ignore_errors=True)
 
-            next
-            
 
 def import_weekly_data(
         years, 
@@ -271,46 +657,37 @@ def import_weekly_data(
     """
     
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-        
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
+    __validate_years(years, 1999)
     
     if not columns:
         columns = []
 
     url = r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{0}.parquet'
 
+    # converts float64 to float32 as each season is read, saves ~30% memory
+    # without holding every season at full width before the concat
+    if downcast:
+        print('Downcasting floats.')
+
     if thread_requests:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the data
-            futures_map = {
-                executor.submit(
-                    pandas.read_parquet,
-                    path=url.format(year),
-                    columns=columns if columns else None,
-                    engine='auto'
-                ): idx
-                for idx, year in enumerate(years)
-            }
-            for future in as_completed(futures_map):
-                data[futures_map[future]] = future.result()
-            data = pandas.concat(data)
+        data = __parallel_read_parquet(
+            [url.format(year) for year in years],
+            columns=columns if columns else None,
+            downcast=downcast
+        )
     else:
         # read weekly data
-        data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])        
+        data = []
+        for x in years:
+            df = __read_parquet(url.format(x), columns=columns if columns else None)
+            data.append(__downcast_floats(df) if downcast else df)
 
-    if columns:
-        data = data[columns]
+    # columns are projected at read time, so the frames only need one concat
+    data = pandas.concat(data, ignore_index=True, copy=False)
 
-    # converts float64 to float32, saves ~30% memory
+    # columns missing from some seasons can come back from the concat as float64
     if downcast:
-        print('Downcasting floats.')
-        cols = data.select_dtypes(include=[numpy.float64]).columns
-        data[cols] = data[cols].astype(numpy.float32)
+        data = __downcast_floats(data)
 
     return data
 
@@ -326,65 +703,74 @@ def import_seasonal_data(years, s_type='REG'):
     """
     
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('years input must be list or range.')
-        
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
+    __validate_years(years, 1999)
         
     if s_type not in ('REG','ALL','POST'):
         raise ValueError('Only REG, ALL, POST allowed for s_type.')
     
     # import weekly data
     url = r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{0}.parquet'
-    data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    data = pandas.concat(__read_parquets(url.format(x) for x in years), ignore_index=True, copy=False)
     
     # filter to appropriate season_type
     if s_type != 'ALL':
         data = data[(data['season_type'] == s_type)]
 
-    # calc per game stats
-    pgstats = data[['recent_team', 'season', 'week', 'attempts', 'completions', 'passing_yards', 'passing_tds',
-                      'passing_air_yards', 'passing_yards_after_catch', 'passing_first_downs',
-                      'fantasy_points_ppr']].groupby(
-        ['recent_team', 'season', 'week']).sum().reset_index()
-    pgstats.columns = ['recent_team', 'season', 'week', 'atts', 'comps', 'p_yds', 'p_tds', 'p_ayds', 'p_yac', 'p_fds',
-                       'ppr_pts']
-    all_stats = data[
-        ['player_id', 'player_name', 'recent_team', 'season', 'week', 'carries', 'rushing_yards', 'rushing_tds',
+    # calc per game team totals and broadcast them back onto each player row
+    team_totals = data.groupby(['recent_team', 'season', 'week'])[
+        ['attempts', 'completions', 'passing_yards', 'passing_tds', 'passing_air_yards',
+         'passing_yards_after_catch', 'passing_first_downs', 'fantasy_points_ppr']].transform('sum')
+    team_totals.columns = ['atts', 'comps', 'p_yds', 'p_tds', 'p_ayds', 'p_yac', 'p_fds', 'ppr_pts']
+    all_stats = pandas.concat([data[
+        ['player_id', 'season', 'carries', 'rushing_yards', 'rushing_tds',
          'rushing_first_downs', 'rushing_2pt_conversions', 'receptions', 'targets', 'receiving_yards', 'receiving_tds',
          'receiving_air_yards', 'receiving_yards_after_catch', 'receiving_first_downs', 'receiving_epa',
-         'fantasy_points_ppr']].merge(pgstats, how='left', on=['recent_team', 'season', 'week']).fillna(0)
-    season_stats = all_stats.drop(['recent_team', 'week'], axis=1).groupby(
-        ['player_id', 'season']).sum(numeric_only=True).reset_index()
-
-    # calc custom receiving stats
-    season_stats['tgt_sh'] = season_stats['targets'] / season_stats['atts']
-    season_stats['ay_sh'] = season_stats['receiving_air_yards'] / season_stats['p_ayds']
-    season_stats['yac_sh'] = season_stats['receiving_yards_after_catch'] / season_stats['p_yac']
-    season_stats['wopr'] = season_stats['tgt_sh'] * 1.5 + season_stats['ay_sh'] * 0.8
-    season_stats['ry_sh'] = season_stats['receiving_yards'] / season_stats['p_yds']
-    season_stats['rtd_sh'] = season_stats['receiving_tds'] / season_stats['p_tds']
-    season_stats['rfd_sh'] = season_stats['receiving_first_downs'] / season_stats['p_fds']
-    season_stats['rtdfd_sh'] = (season_stats['receiving_tds'] + season_stats['receiving_first_downs']) / (
-                season_stats['p_tds'] + season_stats['p_fds'])
-    season_stats['dom'] = (season_stats['ry_sh'] + season_stats['rtd_sh']) / 2
-    season_stats['w8dom'] = season_stats['ry_sh'] * 0.8 + season_stats['rtd_sh'] * 0.2
-    season_stats['yptmpa'] = season_stats['receiving_yards'] / season_stats['atts']
-    season_stats['ppr_sh'] = season_stats['fantasy_points_ppr'] / season_stats['ppr_pts']
-
-    data.drop(['recent_team', 'week'], axis=1, inplace=True)
-    szn = data.groupby(['player_id', 'season', 'season_type']).sum(numeric_only=True).reset_index().merge(
-        data[['player_id', 'season', 'season_type']].groupby(['player_id', 'season']).count().reset_index().rename(
-            columns={'season_type': 'games'}), how='left', on=['player_id', 'season'])
-
-    szn = szn.merge(season_stats[['player_id', 'season', 'tgt_sh', 'ay_sh', 'yac_sh', 'wopr', 'ry_sh', 'rtd_sh',
-                                  'rfd_sh', 'rtdfd_sh', 'dom', 'w8dom', 'yptmpa', 'ppr_sh']], how='left',
-                    on=['player_id', 'season'])
+         'fantasy_points_ppr']], team_totals], axis=1).fillna(0)
+    season_groups = all_stats.groupby(['player_id', 'season'])
+    season_stats = season_groups.sum()
+    # games played comes from the same grouping instead of a separate count and merge
+    season_stats['games'] = season_groups.size()
+    season_stats = season_stats.reset_index()
+
+    # calc custom receiving stats on the underlying arrays and attach them in one step
+    stat = {col: season_stats[col].to_numpy(dtype=numpy.float64) for col in (
+        'targets', 'atts', 'receiving_air_yards', 'p_ayds', 'receiving_yards_after_catch', 'p_yac',
+        'receiving_yards', 'p_yds', 'receiving_tds', 'p_tds', 'receiving_first_downs', 'p_fds',
+        'fantasy_points_ppr', 'ppr_pts'
+    )}
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        tgt_sh = stat['targets'] / stat['atts']
+        ay_sh = stat['receiving_air_yards'] / stat['p_ayds']
+        ry_sh = stat['receiving_yards'] / stat['p_yds']
+        rtd_sh = stat['receiving_tds'] / stat['p_tds']
+        season_stats = season_stats.assign(
+            tgt_sh=tgt_sh,
+            ay_sh=ay_sh,
+            yac_sh=stat['receiving_yards_after_catch'] / stat['p_yac'],
+            wopr=tgt_sh * 1.5 + ay_sh * 0.8,
+            ry_sh=ry_sh,
+            rtd_sh=rtd_sh,
+            rfd_sh=stat['receiving_first_downs'] / stat['p_fds'],
+            rtdfd_sh=(stat['receiving_tds'] + stat['receiving_first_downs']) / (stat['p_tds'] + stat['p_fds']),
+            dom=(ry_sh + rtd_sh) / 2,
+            w8dom=ry_sh * 0.8 + rtd_sh * 0.2,
+            yptmpa=stat['receiving_yards'] / stat['atts'],
+            ppr_sh=stat['fantasy_points_ppr'] / stat['ppr_pts']
+        )
+
+    # sum only the stat columns rather than letting groupby sift through every column
+    sum_cols = [col for col in data.select_dtypes(include=['number', 'bool']).columns
+                if col not in ('season', 'week')]
+    szn = data[['player_id', 'season', 'season_type'] + sum_cols].groupby(
+        ['player_id', 'season', 'season_type']).sum().reset_index().merge(
+        season_stats[['player_id', 'season', 'games', 'tgt_sh', 'ay_sh', 'yac_sh', 'wopr', 'ry_sh', 'rtd_sh',
+                      'rfd_sh', 'rtdfd_sh', 'dom', 'w8dom', 'yptmpa', 'ppr_sh']], how='left',
+        on=['player_id', 'season'])
 
     return szn
 
 
+@functools.lru_cache(maxsize=1)
 def see_pbp_cols():
     """Identifies list of columns in pbp data
     
@@ -392,13 +778,13 @@ def see_pbp_cols():
         list
     """
     
-    # load pbp file, identify columns
-    data = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_2020.parquet', engine='auto')
-    cols = data.columns
+    # read pbp file footer, identify columns
+    cols = __read_parquet_columns(r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_2020.parquet')
 
     return cols
 
 
+@functools.lru_cache(maxsize=1)
 def see_weekly_cols():
     """Identifies list of columns in weekly data
     
@@ -406,9 +792,8 @@ def see_weekly_cols():
         list
     """
     
-    # load weekly file, identify columns
-    data = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_2020.parquet', engine='auto')
-    cols = data.columns
+    # read weekly file footer, identify columns
+    cols = __read_parquet_columns(r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_2020.parquet')
 
     return cols
 
@@ -418,18 +803,15 @@ def __import_rosters(release, years, columns=None):
     
     Args:
         years (List[int]): years to get rosters for
-        columns (List[str]): list of columns to return with DataFrame
+        columns (List[str]): columns the caller will return, only these and
+            the ones needed for post-processing are read
         
     Returns:
         DataFrame
     """
 
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('years input must be list or range.')
-
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
+    __validate_years(years, 1999)
 
     if release not in ('seasonal', 'weekly'):
         raise ValueError("release input must be 'seasonal' or 'weekly'.")
@@ -448,11 +830,22 @@ def __import_rosters(release, years, columns=None):
     elif release == "weekly":
         uri += "weekly_rosters/roster_weekly_{0}.parquet"
 
+    # the columns asked for by their published names, plus the keys used for age and cleanup
+    read_cols = None
+    if columns:
+        raw_names = {'player_id': 'gsis_id', 'player_name': 'full_name'}
+        needed = ['season', 'gsis_id', 'birth_date']
+        if release == "weekly":
+            needed += ['week', 'team']
+        read_cols = list(dict.fromkeys(
+            needed + [raw_names.get(x, x) for x in columns if x != 'age']
+        ))
+
     # imports rosters for specified years
-    rosters = pandas.concat([
-        pandas.read_parquet(uri.format(y))
-        for y in years
-    ], ignore_index=True)
+    rosters = pandas.concat(
+        __read_parquets((uri.format(y) for y in years), columns=read_cols),
+        ignore_index=True, copy=False
+    )
     
     # Post-import processing
     rosters['birth_date'] = pandas.to_datetime(rosters.birth_date)
@@ -460,8 +853,6 @@ def __import_rosters(release, years, columns=None):
         columns={'gsis_id': 'player_id', 'full_name': 'player_name'},
         inplace=True
     )
-    if columns:
-        rosters = rosters[columns]
 
     return rosters
 
@@ -478,22 +869,27 @@ def import_weekly_rosters(years, columns=None):
     """
     rosters = __import_rosters("weekly", years, columns)
     
-    scheds = pandas.read_csv("http://www.habitatring.com/games.csv")
     common_cols = ["season", "week", "gameday"]
-    week_team_dates = pandas.concat([
-        scheds[common_cols + ["home_team"]].rename(columns={"home_team": "team"}),
-        scheds[common_cols + ["away_team"]].rename(columns={"away_team": "team"})
-    ])
-    roster_dates = pandas.to_datetime(
-        rosters.merge(
-            week_team_dates,
-            on=["season", "week", "team"],
-            how="left"
-        ).gameday
+    scheds = __read_csv(
+        "http://www.habitatring.com/games.csv",
+        usecols=common_cols + ["home_team", "away_team"]
     )
+    scheds = scheds[scheds.season.isin(years)]
+    week_team_dates = scheds.melt(
+        id_vars=common_cols,
+        value_vars=["home_team", "away_team"],
+        value_name="team"
+    ).drop(columns="variable")
+    week_team_dates["gameday"] = pandas.to_datetime(week_team_dates.gameday)
+    # only the join keys are merged so the roster columns aren't copied
+    roster_dates = rosters[["season", "week", "team"]].merge(
+        week_team_dates,
+        on=["season", "week", "team"],
+        how="left"
+    ).gameday.to_numpy()
     rosters["age"] = ((roster_dates - rosters.birth_date).dt.days / 365.25).round(3)
     
-    return rosters
+    return rosters[columns] if columns else rosters
     
 
 def import_seasonal_rosters(years, columns=None):
@@ -509,21 +905,17 @@ def import_seasonal_rosters(years, columns=None):
     
     rosters = __import_rosters("seasonal", years, columns)
     
-    # calculate age in season
+    # calculate age as of the season start on September 1st
     if 'birth_date' in rosters.columns:
-        rosters['szn_start'] = pandas.to_datetime(
-            rosters.season.apply(lambda x: datetime.datetime(int(x), 9, 1))
-        )
+        birth_date = rosters.birth_date.dt
         rosters["age"] = (
-            rosters.szn_start.dt.year - rosters.birth_date.dt.year  + numpy.where(
-                rosters.szn_start.dt.month > rosters.birth_date.dt.month, 0, -1
-            )
+            rosters.season.to_numpy() - birth_date.year.to_numpy()
+            - (birth_date.month.to_numpy() >= 9).astype(numpy.int8)
         )
-        rosters.drop(['szn_start'], axis=1, inplace=True)
         
     rosters.dropna(subset=['player_id'], inplace=True)
 
-    return rosters
+    return rosters[columns] if columns else rosters
 
 
 def import_players():
@@ -532,7 +924,7 @@ def import_players():
     Returns:
         DataFrame
     """
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/players/players.parquet')
+    df = __read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/players/players.parquet')
     return df
     
     
@@ -544,7 +936,7 @@ def import_team_desc():
     """
     
     # import desc data
-    df = pandas.read_csv(r'https://github.com/nflverse/nflfastR-data/raw/master/teams_colors_logos.csv')
+    df = __read_csv(r'https://github.com/nflverse/nflfastR-data/raw/master/teams_colors_logos.csv')
     
     return df
 
@@ -560,17 +952,11 @@ def import_schedules(years):
     """
     
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-    
-    if min(years) < 1999:
-        raise ValueError('Data not available before 1999.')
-    
-    scheds = pandas.DataFrame()
+    __validate_years(years, 1999)
     
     # import schedule for specified years
-    scheds = pandas.read_csv(r'http://www.habitatring.com/games.csv')    
-    scheds = scheds[scheds['season'].isin(years)]
+    scheds = __read_csv(r'http://www.habitatring.com/games.csv')
+    scheds = scheds.loc[scheds['season'].isin(list(years))].reset_index(drop=True)
         
     return scheds
     
@@ -595,10 +981,16 @@ def import_win_totals(years = None):
     
     # import win totals
     url = "https://raw.githubusercontent.com/mrcaseb/nfl-data/master/data/nfl_lines_odds.csv.gz"
-    df = pandas.read_csv(url).loc[lambda df: df.game_id.notna()]
-    df["season"] = df.game_id.str[:4].astype(int)
+    df = __read_csv(url).loc[lambda df: df.game_id.notna()]
+    seasons = __game_id_seasons(df.game_id)
+    
+    # filter on the season array before it becomes a column of the frame
+    if years:
+        keep = numpy.isin(seasons, list(years))
+        df, seasons = df[keep], seasons[keep]
+    df["season"] = seasons
 
-    return df[df['season'].isin(years)] if years else df
+    return df
     
 
 def import_officials(years=None):
@@ -619,11 +1011,14 @@ def import_officials(years=None):
         raise ValueError('years variable must be list or range.')
 
     # import officials data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/officials.csv')
-    df['season'] = df['game_id'].str[0:4].astype(int)
+    df = __read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/officials.csv')
+    seasons = __game_id_seasons(df['game_id'])
     
+    # filter on the season array before it becomes a column of the frame
     if len(years) > 0:
-        df = df[df['season'].isin(years)]
+        keep = numpy.isin(seasons, list(years))
+        df, seasons = df[keep], seasons[keep]
+    df['season'] = seasons
     
     return df
     
@@ -646,7 +1041,7 @@ def import_sc_lines(years=None):
         raise ValueError('years variable must be list or range.')
     
     # import data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/sc_lines.csv')
+    df = __read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/sc_lines.csv')
     
     if len(years) > 0:
         df = df[df['season'].isin(years)]
@@ -672,7 +1067,10 @@ def import_draft_picks(years=None):
         raise ValueError('years variable must be list or range.')
 
     # import draft pick data
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/draft_picks/draft_picks.parquet', engine='auto')
+    df = __read_parquet(
+        r'https://github.com/nflverse/nflverse-data/releases/download/draft_picks/draft_picks.parquet',
+        filters=[('season', 'in', list(years))] if len(years) > 0 else None
+    )
     
     if len(years) > 0:
         df = df[df['season'].isin(years)]  
@@ -698,7 +1096,7 @@ def import_draft_values(picks=None):
         raise ValueError('picks variable must be list or range.')
 
     # import data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/draft_values.csv')
+    df = __read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/draft_values.csv')
 
     if len(picks) > 0:
         df = df[df['pick'].between(picks[0], picks[-1])]
@@ -731,7 +1129,10 @@ def import_combine_data(years=None, positions=None):
         raise ValueError('positions variable must be list.')
         
     # import data
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/combine/combine.parquet', engine='auto')
+    df = __read_parquet(
+        r'https://github.com/nflverse/nflverse-data/releases/download/combine/combine.parquet',
+        filters=[('season', 'in', list(years))] if len(years) > 0 else None
+    )
     
     # filter to years and positions
     if len(years) > 0 and len(positions) > 0:
@@ -763,15 +1164,18 @@ def import_ids(columns=None, ids=None):
     if not isinstance(ids, Iterable):
         raise ValueError('ids argument must be a list.')
         
-    df = pandas.read_csv("https://raw.githubusercontent.com/dynastyprocess/data/master/files/db_playerids.csv")
+    df = __read_csv("https://raw.githubusercontent.com/dynastyprocess/data/master/files/db_playerids.csv")
     
     id_cols = [c for c in df.columns if c.endswith('_id')]
     non_id_cols = [c for c in df.columns if not c.endswith('_id')]
     
-    # filter df to just specified ids + columns
+    # filter df to just specified ids + columns, deduplicated in order
     ret_ids = [x + '_id' for x in ids] or id_cols
+    unknown_ids = set(ret_ids).difference(id_cols)
+    if unknown_ids:
+        raise ValueError('ids not available: ' + ', '.join(sorted(x[:-3] for x in unknown_ids)))
     ret_cols = columns or non_id_cols
-    ret_columns = list(set([*ret_ids, *ret_cols]))
+    ret_columns = list(dict.fromkeys([*ret_ids, *ret_cols]))
 
     return df[ret_columns]
     
@@ -783,7 +1187,7 @@ def import_contracts():
         DataFrame
     """
     
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/contracts/historical_contracts.parquet')
+    df = __read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/contracts/historical_contracts.parquet')
     
     return df
     
@@ -810,10 +1214,10 @@ def import_ngs_data(stat_type, years=None):
     
     # import data
     url = r'https://github.com/nflverse/nflverse-data/releases/download/nextgen_stats/ngs_{0}.parquet'.format(stat_type)
-    data = pandas.read_parquet(url)
+    data = __read_parquet(url, filters=[('season', 'in', list(years))] if len(years) > 0 else None)
     
     if len(years) > 0:
-        data = data[data['season'].isin([x for x in years])]
+        data = data[data['season'].isin(years)]
     
     # return
     return data
@@ -832,17 +1236,12 @@ def import_depth_charts(years):
     if years is None:
         raise ValueError('Must specify timeframe.')
         
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-    
-    if len(years) > 0:
-        if min(years) < 2001:
-            raise ValueError('Data not available before 2001.')
+    __validate_years(years, 2001)
     
     # import data
     url = r'https://github.com/nflverse/nflverse-data/releases/download/depth_charts/depth_charts_{0}.parquet'
 
-    df = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    df = pandas.concat(__read_parquets(url.format(x) for x in years), ignore_index=True, copy=False)
     
     return df
     
@@ -860,17 +1259,12 @@ def import_injuries(years):
     if years is None:
         raise ValueError('Must specify timeframe.')
         
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-    
-    if len(years) > 0:
-        if min(years) < 2009:
-            raise ValueError('Data not available before 2009.')
+    __validate_years(years, 2009)
     
     #import data
     url = r'https://github.com/nflverse/nflverse-data/releases/download/injuries/injuries_{0}.parquet'
 
-    df = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    df = pandas.concat(__read_parquets(url.format(x) for x in years), ignore_index=True, copy=False)
     
     return df
     
@@ -890,12 +1284,7 @@ def import_qbr(years=None, level='nfl', frequency='season'):
     if years is None:
         years = []
         
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-    
-    if len(years) > 0:
-        if min(years) < 2006:
-            raise ValueError('Data not available before 2006.')
+    __validate_years(years, 2006)
     
     if level not in ('nfl','college'):
         raise ValueError('level must be nfl or college')
@@ -906,11 +1295,11 @@ def import_qbr(years=None, level='nfl', frequency='season'):
     # import data
     url = r'https://raw.githubusercontent.com/nflverse/espnscrapeR-data/master/data/qbr-{}-{}.csv'.format(level, frequency)
 
-    df = pandas.read_csv(url)
+    df = __read_csv(url)
             
     # filter to desired years
     if len(years) > 0:
-        df = df[df['season'].between(min(years), max(years))]
+        df = df[df['season'].isin(years)]
     
     return df
 
@@ -925,13 +1314,15 @@ def __validate_pfr_inputs(s_type, years=None):
     if not isinstance(years, Iterable):
         raise ValueError("years must be an Iterable.")
     
-    years = list(years)
+    # ranges are passed through, other iterables are read once into a list
+    if not isinstance(years, range):
+        years = list(years)
 
-    if not all(isinstance(x, int) for x in years):
-        raise ValueError('years variable must only contain integers.')
-
-    if years and min(years) < 2018:
-        raise ValueError('Data not available before 2018.')
+    for year in years:
+        if not isinstance(year, int):
+            raise ValueError('years variable must only contain integers.')
+        if year < 2018:
+            raise ValueError('Data not available before 2018.')
 
     return years
     
@@ -948,7 +1339,7 @@ def import_seasonal_pfr(s_type, years=None):
     years = __validate_pfr_inputs(s_type, years)
 
     url = f"https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_{s_type}.parquet"
-    df = pandas.read_parquet(url)
+    df = __read_parquet(url, filters=[('season', 'in', list(years))] if years else None)
 
     return df[df.season.isin(years)] if years else df
 
@@ -969,10 +1360,7 @@ def import_weekly_pfr(s_type, years=None):
         years = list(import_seasonal_pfr(s_type).season.unique())
     
     url = "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_week_{0}_{1}.parquet"
-    df = pandas.concat([
-        pandas.read_parquet(url.format(s_type, yr))
-        for yr in years
-    ])
+    df = pandas.concat(__read_parquets(url.format(s_type, yr) for yr in years), ignore_index=True, copy=False)
     
     return df[df.season.isin(years)] if years else df
     
@@ -990,20 +1378,12 @@ def import_snap_counts(years):
     if years is None:
         raise ValueError('Must provide years variable.')
         
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-    
-    if len(years) > 0:
-        if min(years) < 2012:
-            raise ValueError('Data not available before 2012.')
-    
-    df = pandas.DataFrame()
+    __validate_years(years, 2012)
     
     # import data
-        
     url = r'https://github.com/nflverse/nflverse-data/releases/download/snap_counts/snap_counts_{0}.parquet'
 
-    df = pandas.concat([pandas.read_parquet(url.format(x)) for x in years])
+    df = pandas.concat(__read_parquets(url.format(x) for x in years), ignore_index=True, copy=False)
     
     return df
 
@@ -1033,40 +1413,32 @@ def import_ftn_data(
     """
     
     # check variable types
-    if not isinstance(years, (list, range)):
-        raise ValueError('Input must be list or range.')
-        
-    if min(years) < 2022:
-        raise ValueError('Data not available before 2022.')
+    __validate_years(years, 2022)
 
     url = r'https://github.com/nflverse/nflverse-data/releases/download/ftn_charting/ftn_charting_{0}.parquet'
 
+    # converts float64 to float32 as each season is read, saves ~30% memory
+    if downcast:
+        print('Downcasting floats.')
+
     if thread_requests:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the data
-            futures_map = {
-                executor.submit(
-                    pandas.read_parquet,
-                    path=url.format(year),
-                    columns=columns if columns else None,
-                    engine='auto'
-                ): idx
-                for idx, year in enumerate(years)
-            }
-            for future in as_completed(futures_map):
-                data[futures_map[future]] = future.result()
-            data = pandas.concat(data)
+        data = __parallel_read_parquet(
+            [url.format(year) for year in years],
+            columns=columns if columns else None,
+            downcast=downcast
+        )
     else:
         # read charting data
-        data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto', columns=columns) for x in years])
+        data = []
+        for x in years:
+            df = __read_parquet(url.format(x), columns=columns)
+            data.append(__downcast_floats(df) if downcast else df)
 
-    # converts float64 to float32, saves ~30% memory
+    data = pandas.concat(data, ignore_index=True, copy=False)
+
+    # columns missing from some seasons can come back from the concat as float64
     if downcast:
-        print('Downcasting floats.')
-        cols = data.select_dtypes(include=[numpy.float64]).columns
-        data[cols] = data[cols].astype(numpy.float32)
+        data = __downcast_floats(data)
 
     return data
 
@@ -1081,76 +1453,16 @@ def clean_nfl_data(df):
         DataFrame
     """
 
-    name_repl = {
-        'Gary Jennings Jr': 'Gary Jennings',
-        'DJ Chark': 'D.J. Chark',
-        'Cedrick Wilson Jr.': 'Cedrick Wilson',
-        'Deangelo Yancey': 'DeAngelo Yancey',
-        'Ardarius Stewart': 'ArDarius Stewart',
-        'Calvin Johnson  HOF': 'Calvin Johnson',
-        'Mike Sims-Walker': 'Mike Walker',
-        'Kenneth Moore': 'Kenny Moore',
-        'Devante Parker': 'DeVante Parker',
-        'Brandon Lafell': 'Brandon LaFell',
-        'Desean Jackson': 'DeSean Jackson',
-        'Deandre Hopkins': 'DeAndre Hopkins',
-        'Deandre Smelter': 'DeAndre Smelter',
-        'William Fuller': 'Will Fuller',
-        'Lavon Brazill': 'LaVon Brazill',
-        'Devier Posey': 'DeVier Posey',
-        'Demarco Sampson': 'DeMarco Sampson',
-        'Deandrew Rubin': 'DeAndrew Rubin',
-        'Latarence Dunbar': 'LaTarence Dunbar',
-        'Jajuan Dawson': 'JaJuan Dawson',
-        "Andre' Davis": 'Andre Davis',
-        'Johnathan Holland': 'Jonathan Holland',
-        'Johnnie Lee Higgins Jr.': 'Johnnie Lee Higgins',
-        'Marquis Walker': 'Marquise Walker',
-        'William Franklin': 'Will Franklin',
-        'Ted Ginn Jr.': 'Ted Ginn',
-        'Jonathan Baldwin': 'Jon Baldwin',
-        'T.J. Graham': 'Trevor Graham',
-        'Odell Beckham Jr.': 'Odell Beckham',
-        'Michael Pittman Jr.': 'Michael Pittman',
-        'DK Metcalf': 'D.K. Metcalf',
-        'JJ Arcega-Whiteside': 'J.J. Arcega-Whiteside',
-        'Lynn Bowden Jr.': 'Lynn Bowden',
-        'Laviska Shenault Jr.': 'Laviska Shenault',
-        'Henry Ruggs III': 'Henry Ruggs',
-        'KJ Hamler': 'K.J. Hamler',
-        'KJ Osborn': 'K.J. Osborn',
-        'Devonta Smith': 'DeVonta Smith',
-        'Terrace Marshall Jr.': 'Terrace Marshall',
-        "Ja'Marr Chase": 'JaMarr Chase'
-    }
-
-    col_tm_repl = {
-        'Ole Miss': 'Mississippi',
-        'Texas Christian': 'TCU',
-        'Central Florida': 'UCF',
-        'Bowling Green State': 'Bowling Green',
-        'West. Michigan': 'Western Michigan',
-        'Pitt': 'Pittsburgh',
-        'Brigham Young': 'BYU',
-        'Texas-El Paso': 'UTEP',
-        'East. Michigan': 'Eastern Michigan',
-        'Middle Tenn. State': 'Middle Tennessee State',
-        'Southern Miss': 'Southern Mississippi',
-        'Louisiana State': 'LSU'
-    }
-
-    na_replace = {
-        'NA':numpy.nan
-    }
-
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df.replace({col:na_replace}, inplace=True)
+    # blank out 'NA' strings across all object columns in one pass
+    obj_cols = df.columns[(df.dtypes == 'object').to_numpy()]
+    if len(obj_cols) > 0:
+        # dtypes are re-inferred as replace did, so an all 'NA' column becomes float
+        df[obj_cols] = df[obj_cols].mask(df[obj_cols] == 'NA').infer_objects()
 
     if 'name' in df.columns:
-        df.replace({'name': name_repl}, inplace=True)
+        df['name'] = df['name'].map(_NAME_REPL).fillna(df['name'])
 
     if 'col_team' in df.columns:
-        df.replace({'col_team': col_tm_repl}, inplace=True)
+        df['col_team'] = df['col_team'].map(_COL_TM_REPL).fillna(df['col_team'])
 
     return df
@@ -1,38 +1,41 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 from pathlib import Path
+from functools import lru_cache
+import tempfile
+import hashlib
 import shutil
-import random
+import os
 
+from fsspec.parquet import open_parquet_file
+import numpy as np
 import pandas as pd
 
 import nfl_data_py as nfl
 
 
 class test_pbp(TestCase):
-    pbp = nfl.import_pbp_data([2020])
+    @classmethod
+    def setUpClass(cls):
+        cls.pbp = get_pbp_2020()
 
     def test_is_df_with_data(self):
         self.assertIsInstance(self.pbp, pd.DataFrame)
-        self.assertTrue(len(self.pbp) > 0)
+        self.assertFalse(self.pbp.empty)
 
     def test_is_df_with_data_thread_requests(self):
         s = nfl.import_pbp_data([2020, 2021], thread_requests=True)
         self.assertIsInstance(s, pd.DataFrame)
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
 		
     def test_uses_cache_when_cache_is_true(self):
-        cache = Path(__file__).parent/f"tmpcache-{random.randint(0, 10000)}"
+        cache = make_cache_path(self)
         self.assertRaises(
             ValueError,
             nfl.import_pbp_data, [2020], cache=True, alt_path=cache
         )
         
-        nfl.cache_pbp([2020], alt_path=cache)
-        
-        data = nfl.import_pbp_data([2020], cache=True, alt_path=cache)
+        data = nfl.import_pbp_data([2020], cache=True, alt_path=get_pbp_2020_cache())
         self.assertIsInstance(data, pd.DataFrame)
-        
-        shutil.rmtree(cache)
 
     def test_includes_participation_by_default(self):
         self.assertIn("offense_players", self.pbp.columns)
@@ -40,56 +43,89 @@ class test_pbp(TestCase):
     def test_excludes_participation_when_requested(self):
         data = nfl.import_pbp_data([2020], include_participation=False)
         self.assertIsInstance(self.pbp, pd.DataFrame)
-        self.assertTrue(len(self.pbp) > 0)
+        self.assertFalse(self.pbp.empty)
         self.assertNotIn("offense_players", data.columns)
 
     def test_excludes_participation_if_not_available(self):
-        data = nfl.import_pbp_data([2024])
-        self.assertIsInstance(self.pbp, pd.DataFrame)
-        self.assertTrue(len(self.pbp) > 0)
+        # asking for a participation column still exercises the fallback,
+        # but only the named column chunks are downloaded
+        data = nfl.import_pbp_data([2024], columns=["play_id", "game_id", "offense_players"])
+        self.assertIsInstance(data, pd.DataFrame)
+        self.assertFalse(data.empty)
         self.assertNotIn("offense_players", data.columns)
+
+    def test_fills_participation_columns_missing_from_season(self):
+        # a season whose participation file was published without "route"
+        plays = pd.DataFrame({"play_id": [1, 2], "game_id": ["g1", "g1"], "epa": [0.1, 0.2]})
+        partic = pd.DataFrame({
+            "play_id": [1, 2], "nflverse_game_id": ["g1", "g1"], "offense_players": ["a", "b"]
+        })
+        
+        def read_parquet(path, columns=None, filters=None):
+            df = partic if "participation" in path else plays
+            return (df[columns] if columns else df).copy()
+        
+        fakes = {
+            "__read_parquet": read_parquet,
+            "__read_parquet_columns": lambda url: partic.columns
+        }
+        for thread_requests in (False, True):
+            with self.subTest(thread_requests=thread_requests), mock.patch.dict(nfl.__dict__, fakes):
+                data = nfl.import_pbp_data(
+                    [2020], columns=["epa", "offense_players", "route"],
+                    thread_requests=thread_requests
+                )
+                self.assertEqual(data.offense_players.tolist(), ["a", "b"])
+                self.assertTrue(data.route.isna().all())
         
         
 class test_weekly(TestCase):
     def test_is_df_with_data(self):
-        s = nfl.import_weekly_data([2020])
+        s = get_weekly_2020()
         self.assertIsInstance(s, pd.DataFrame)
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
 
     def test_is_df_with_data_thread_requests(self):
         s = nfl.import_weekly_data([2020, 2021], thread_requests=True)
         self.assertIsInstance(s, pd.DataFrame)
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
         
 class test_seasonal(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_seasonal_data([2020])
         self.assertIsInstance(s, pd.DataFrame)
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
         
 class test_pbp_cols(TestCase):
     def test_is_list_with_data(self):
         s = nfl.see_pbp_cols()
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
         
 class test_weekly_cols(TestCase):
     def test_is_list_with_data(self):
         s = nfl.see_weekly_cols()
-        self.assertTrue(len(s) > 0)
+        self.assertFalse(s.empty)
         
 class test_seasonal_rosters(TestCase):
-    data = nfl.import_seasonal_rosters([2020])
-    
+    @classmethod
+    def setUpClass(cls):
+        cls.data = nfl.import_seasonal_rosters([2020])
+
     def test_is_df_with_data(self):
         self.assertIsInstance(self.data, pd.DataFrame)
-        self.assertTrue(len(self.data) > 0)
+        self.assertFalse(self.data.empty)
 
     def test_import_multiple_years(self):
-        s = nfl.import_weekly_rosters([2022, 2023])
+        s = get_weekly_rosters_2022_2023()
         self.assertIsInstance(s, pd.DataFrame)
         self.assertGreater(len(s), len(self.data))
         self.assertListEqual(s.season.unique().tolist(), [2022, 2023])
         
+    def test_import_using_columns(self):
+        s = nfl.import_seasonal_rosters([2020], columns=["season", "player_name", "age"])
+        self.assertListEqual(s.columns.tolist(), ["season", "player_name", "age"])
+        self.assertFalse(s.empty)
+        
     def test_computes_age_as_of_season_start(self):
         mahomes_ages = get_pat(self.data).age
         self.assertEqual(len(mahomes_ages), 1)
@@ -97,74 +133,82 @@ class test_seasonal_rosters(TestCase):
         
 
 class test_weekly_rosters(TestCase):
-    data = nfl.import_weekly_rosters([2022])
-        
+    @classmethod
+    def setUpClass(cls):
+        cls.data = nfl.import_weekly_rosters([2022])
+
     def test_is_df_with_data(self):
-        assert isinstance(self.data, pd.DataFrame)
-        self.assertGreater(len(self.data), 0)
+        self.assertIsInstance(self.data, pd.DataFrame)
+        self.assertFalse(self.data.empty)
 
     def test_import_multiple_years(self):
-        s = nfl.import_weekly_rosters([2022, 2023])
+        s = get_weekly_rosters_2022_2023()
         self.assertIsInstance(s, pd.DataFrame)
         self.assertGreater(len(s), len(self.data))
         self.assertListEqual(s.season.unique().tolist(), [2022, 2023])
         
+    def test_import_using_columns(self):
+        s = nfl.import_weekly_rosters([2022], columns=["week", "player_name", "age"])
+        self.assertListEqual(s.columns.tolist(), ["week", "player_name", "age"])
+        self.assertFalse(s.empty)
+        
     def test_gets_weekly_updates(self):
-        assert isinstance(self.data, pd.DataFrame)
+        self.assertIsInstance(self.data, pd.DataFrame)
         hock = get_hock(self.data)
         self.assertCountEqual(hock[hock.team == 'DET'].week, [1, 2, 3, 4, 5, 7, 8])
         self.assertCountEqual(hock[hock.team == 'MIN'].week, range(9, 20))
         
     def test_computes_age_as_of_week(self):
-        self.assertEqual(
-            get_pat(self.data).sort_values("week").age.to_list(),
+        np.testing.assert_allclose(
+            get_pat(self.data).sort_values("week").age.to_numpy(),
             [
                 26.984, 26.995, 27.023, 27.042, 27.064, 27.08, 27.099,
                 27.138, 27.157, 27.176, 27.195, 27.214, 27.233, 27.253,
                 27.269, 27.291, 27.307, 27.346, 27.368, 27.406
-            ]
+            ],
+            atol=5e-4
         )
         
 class test_team_desc(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_team_desc()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_schedules(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_schedules([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_win_totals(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_win_totals([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
     def test_is_df_with_data_no_years(self):
         s = nfl.import_win_totals()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_officials(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_officials([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_draft_picks(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_draft_picks([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))		
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_draft_values(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_draft_values()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_combine(TestCase):
     def test_is_df_with_data_no_years_no_positions(self):
@@ -190,8 +234,8 @@ class test_combine(TestCase):
 class test_ids(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_ids()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
 
     def test_import_using_ids(self):
         ids = ["espn", "yahoo", "gsis"]
@@ -215,67 +259,79 @@ class test_ids(TestCase):
         self.assertTrue(all([column not in s.columns for column in not_ret_columns]))
         self.assertTrue(all([f"{id}_id" in s.columns for id in ret_ids]))
         self.assertTrue(all([f"{id}_id" not in s.columns for id in not_ret_ids]))
+
+    def test_import_using_unknown_ids(self):
+        with self.assertRaises(ValueError):
+            nfl.import_ids(ids=["espn", "not_a_site"])
         
 class test_ngs(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_ngs_data('passing')
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_clean(TestCase):
     def test_is_df_with_data(self):
-        s = nfl.clean_nfl_data(nfl.import_weekly_data([2020]))
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        # clean_nfl_data edits in place, so it gets a copy of the shared frame
+        s = nfl.clean_nfl_data(get_weekly_2020().copy())
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
+
+    def test_all_na_column_becomes_float(self):
+        s = nfl.clean_nfl_data(pd.DataFrame({"a": ["NA", "NA"], "b": ["x", "NA"]}))
+        self.assertEqual(s.a.dtype, "float64")
+        self.assertTrue(s.a.isna().all())
+        self.assertEqual(s.b.dtype, "object")
         
 class test_depth_charts(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_depth_charts([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_injuries(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_injuries([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_qbr(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_qbr()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_seasonal_pfr(TestCase):
-    df = nfl.import_seasonal_pfr('pass')
-    
+    @classmethod
+    def setUpClass(cls):
+        cls.df = nfl.import_seasonal_pfr('pass')
+
     def test_is_df_with_data(self):
         self.assertIsInstance(self.df, pd.DataFrame)
-        self.assertTrue(len(self.df) > 0)
+        self.assertFalse(self.df.empty)
         
     def test_contains_one_row_per_player_per_season(self):
         pat = get_pat(self.df)
-        self.assertCountEqual(pat.season, pat.season.unique())
+        self.assertEqual(pat.season.nunique(), len(pat.season))
         
     def test_contains_seasonal_exclusive_columns(self):
         self.assertIn("rpo_plays", self.df.columns)
     
     def test_retrieves_all_available_years_by_default(self):
-        available_years = pd.read_parquet(
-            "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_pass.parquet"
-        ).season.unique()
-        self.assertCountEqual(self.df.season.unique(), available_years)
+        self.assertEqual(set(self.df.season.unique()), set(get_pfr_available_years()))
         
     def test_filters_by_year(self):
         only_20_21 = nfl.import_seasonal_pfr('pass', [2020, 2021])
-        self.assertCountEqual(only_20_21.season.unique(), [2020, 2021])
+        self.assertEqual(set(only_20_21.season.unique()), {2020, 2021})
         
 class test_weekly_pfr(TestCase):
-    df = nfl.import_weekly_pfr('pass')
-    
+    @classmethod
+    def setUpClass(cls):
+        cls.df = nfl.import_weekly_pfr('pass')
+
     def test_is_df_with_data(self):
         self.assertIsInstance(self.df, pd.DataFrame)
-        self.assertTrue(len(self.df) > 0)
+        self.assertFalse(self.df.empty)
         
     def test_contains_one_row_per_player_per_week(self):
         test_seasons = self.df.loc[self.df.season.isin(range(2018, 2023))]
@@ -286,69 +342,164 @@ class test_weekly_pfr(TestCase):
         self.assertNotIn("rpo_plays", self.df.columns)
     
     def test_retrieves_all_available_years_by_default(self):
-        available_years = pd.read_parquet(
-            "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_pass.parquet"
-        ).season.unique()
-        self.assertCountEqual(self.df.season.unique(), available_years)
+        self.assertEqual(set(self.df.season.unique()), set(get_pfr_available_years()))
         
     def test_filters_by_year(self):
         only_20_21 = nfl.import_weekly_pfr('pass', [2020, 2021])
-        self.assertCountEqual(only_20_21.season.unique(), [2020, 2021])
+        self.assertEqual(set(only_20_21.season.unique()), {2020, 2021})
     
         
 class test_snaps(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_snap_counts([2020])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
         
 class test_ftn(TestCase):
     def test_is_df_with_data(self):
         s = nfl.import_ftn_data([2023])
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
 
     def test_is_df_with_data_thread_requests(self):
         s = nfl.import_ftn_data([2022, 2023], thread_requests=True)
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
 		
         
 class test_cache(TestCase):
     def test_cache(self):
-        cache = Path(__file__).parent/f"tmpcache-{random.randint(0, 10000)}"
-        self.assertFalse(cache.is_dir())
-        
-        nfl.cache_pbp([2020], alt_path=cache)
-        
+        cache = get_pbp_2020_cache()
         self.assertTrue(cache.is_dir())
 
-        pbp2020 = pd.read_parquet(cache/"season=2020"/"part.0.parquet")
+        # fastparquet writes part.0.parquet, pyarrow a uuid-named file
+        files = list((cache/"season=2020").glob("*.parquet"))
+        self.assertEqual(len(files), 1)
+        pbp2020 = pd.read_parquet(files[0])
         self.assertIsInstance(pbp2020, pd.DataFrame)
         self.assertFalse(pbp2020.empty)
         
-        shutil.rmtree(cache)
+class test_clear_cache(TestCase):
+    def setUp(self):
+        # keep the file cache in a temp dir, so the real one isn't removed
+        # while other test workers are reading from it
+        self.file_cache = make_cache_path(self)
+        patcher = mock.patch.dict(nfl.__dict__, {
+            "__file_cache_dir": lambda: str(self.file_cache),
+            "_FILE_CACHE_FS": {}
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clears_memoized_and_file_caches(self):
+        fetch_bytes = nfl.__dict__["__fetch_bytes"]
+        nfl.import_team_desc()
+        nfl.see_weekly_cols()
+        nfl.import_injuries([2020])
+        self.assertGreater(fetch_bytes.cache_info().currsize, 0)
+        self.assertTrue(self.file_cache.is_dir())
+        
+        nfl.clear_cache()
+        
+        self.assertEqual(fetch_bytes.cache_info().currsize, 0)
+        self.assertEqual(nfl.see_pbp_cols.cache_info().currsize, 0)
+        self.assertEqual(nfl.see_weekly_cols.cache_info().currsize, 0)
+        self.assertFalse(self.file_cache.exists())
+
+    def test_reloads_after_clear(self):
+        first = nfl.import_team_desc()
+        nfl.clear_cache()
+        s = nfl.import_team_desc()
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertTrue(s.equals(first))
         
 class test_contracts(TestCase):
     def test_contracts(self):
         s = nfl.import_contracts()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
         
 class test_players(TestCase):
     def test_players(self):
         s = nfl.import_players()
-        self.assertEqual(True, isinstance(s, pd.DataFrame))
-        self.assertTrue(len(s) > 0)
+        self.assertIsInstance(s, pd.DataFrame)
+        self.assertFalse(s.empty)
 
 
 # ---------------------------- Helper Functions -------------------------------
 
+FIXTURE_CACHE = Path(__file__).parent/"_fixture_cache"
+
+def cached_import(name, loader):
+    # with NFL_TEST_FIXTURE_CACHE=1, keep fixture frames on disk between runs;
+    # otherwise, and with NFL_TEST_REFRESH=1, the importer is always called
+    if os.environ.get("NFL_TEST_FIXTURE_CACHE") != "1":
+        return loader()
+    
+    # keyed by the library source so any change to the importers refetches
+    source_hash = hashlib.sha1(Path(nfl.__file__).read_bytes()).hexdigest()[:12]
+    path = FIXTURE_CACHE/f"{name}-{source_hash}.parquet"
+    if path.exists() and os.environ.get("NFL_TEST_REFRESH") != "1":
+        return pd.read_parquet(path)
+    
+    df = loader()
+    FIXTURE_CACHE.mkdir(exist_ok=True)
+    # written under a per-process name first so parallel workers never read a partial file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    df.to_parquet(tmp, compression="zstd")
+    os.replace(tmp, path)
+    return df
+
+@lru_cache(maxsize=None)
+def get_pbp_2020():
+    # downloaded once per test run and shared by every class that needs it
+    return cached_import("pbp_2020", lambda: nfl.import_pbp_data([2020]))
+
+# row positions per player, built once per frame; the frame is kept alongside
+# so its id can't be reused while the entry exists
+_player_rows = {}
+
 def __get_player(df: pd.DataFrame, player_name: str):
-    player_name_cols = ('player_name', 'player', 'pfr_player_name')
-    player_name_col = set(player_name_cols).intersection(set(df.columns)).pop()
-    return df[df[player_name_col] == player_name]
+    if id(df) not in _player_rows:
+        player_name_cols = ('player_name', 'player', 'pfr_player_name')
+        player_name_col = next(col for col in player_name_cols if col in df.columns)
+        _player_rows[id(df)] = (df, df.groupby(player_name_col, sort=False).indices)
+    return df.iloc[_player_rows[id(df)][1].get(player_name, [])]
+
+@lru_cache(maxsize=None)
+def get_pfr_available_years():
+    # byte-range reads of the footer and the season column chunks only
+    with open_parquet_file(
+        "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_pass.parquet",
+        columns=["season"]
+    ) as f:
+        return pd.read_parquet(f, columns=["season"]).season.unique()
+
+@lru_cache(maxsize=None)
+def get_pbp_2020_cache():
+    # one cache_pbp run shared by the cache tests, removed in tearDownModule
+    cache = Path(tempfile.mkdtemp())/"cache"
+    nfl.cache_pbp([2020], alt_path=cache)
+    return cache
+
+def tearDownModule():
+    if get_pbp_2020_cache.cache_info().currsize:
+        shutil.rmtree(get_pbp_2020_cache().parent, ignore_errors=True)
+
+@lru_cache(maxsize=None)
+def get_weekly_2020():
+    return cached_import("weekly_2020", lambda: nfl.import_weekly_data([2020]))
+
+@lru_cache(maxsize=None)
+def get_weekly_rosters_2022_2023():
+    return cached_import("weekly_rosters_2022_2023", lambda: nfl.import_weekly_rosters([2022, 2023]))
+
+def make_cache_path(test: TestCase):
+    # a not-yet-created directory inside a temp dir removed after the test
+    tmp = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+    return Path(tmp)/"cache"
 
 def get_pat(df):
     return __get_player(df, 'Patrick Mahomes')
@@ -19,11 +19,14 @@ REQUIRED = [
     'numpy>=1.0, <2.0',
     'pandas>=1.0, <2.0',
     'appdirs>1',
-    'fastparquet>0.5',
+    'fastparquet>=0.7',
+    'fsspec[http]>=2021.11.1',
 ]
 
 # What packages are optional?
 EXTRAS = {
+    'pyarrow': ['pyarrow>=1.0'],
+    'test': ['pytest', 'pytest-xdist', 'pyarrow>=1.0'],
 }
 
 # Where the magic happens: